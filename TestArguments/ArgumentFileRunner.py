@@ -0,0 +1,383 @@
+"""\
+Run the test cases in an argument file, sharded and resumable.
+
+Each non-blank line of an argument file that doesn't start with "#"
+is the command line for one test case, e.g.
+
+    --font fonts/Example.ttf --glyph /A
+
+Created on October 19, 2026
+
+@author Eric Mader
+"""
+
+import typing
+
+import os
+import re
+import shlex
+import hashlib
+import tempfile
+
+from .TestArguments import TestArgs
+
+
+class ArgumentFileCase:
+    """\
+    An object that represents one line of an argument file.
+    """
+
+    __slots__ = "_lineNumber", "_arguments", "_key", "cost"
+
+    def __init__(self, lineNumber: int, arguments: list[str], occurrence: int = 0):
+        """\
+        Initialize an ArgumentFileCase.
+
+        The case's key identifies it in journals and shard plans. It's made
+        from the arguments, not the line number, so adding or removing
+        other lines doesn't change it.
+
+        :param lineNumber: the line number of the case in the argument file
+        :param arguments: the case's argument list
+        :param occurrence: the number of earlier cases with the same arguments
+        """
+        self._lineNumber = lineNumber
+        self._arguments = arguments
+        digest = hashlib.sha1("\0".join(arguments).encode("utf-8")).hexdigest()
+        self._key = f"{digest}:{occurrence}"
+        self.cost = 0
+
+    @property
+    def lineNumber(self):
+        return self._lineNumber
+
+    @property
+    def arguments(self):
+        return self._arguments
+
+    @property
+    def key(self):
+        return self._key
+
+
+class ArgumentFileJournal:
+    """\
+    An append-only record of the completed cases of an argument file.
+
+    Each shard appends to its own journal file, so shards running on
+    different machines never write to the same file. All the journal files
+    for the argument file in the journal directory are read when the journal
+    is opened, so a case completed by any shard is skipped by all of them.
+    """
+
+    def __init__(self, journalDirectory: str, argumentFile: str, shardName: str):
+        """\
+        Initialize an ArgumentFileJournal.
+
+        :param journalDirectory: the directory that holds the journal files
+        :param argumentFile: the path of the argument file
+        :param shardName: a name for the shard that's unique among the shards
+        """
+        os.makedirs(journalDirectory, exist_ok=True)
+        self._prefix = os.path.basename(argumentFile) + "."
+        self._pattern = re.compile(re.escape(self._prefix) + r"shard\d+of\d+\.journal")
+        self._directory = journalDirectory
+        self._path = os.path.join(
+            journalDirectory, f"{self._prefix}{shardName}.journal"
+        )
+        self._file: typing.Optional[typing.TextIO] = None
+        self._completed: set[str] = set()
+        self.refresh()
+
+    def refresh(self):
+        """\
+        Re-read all the journal files for the argument file.
+        """
+        for entry in os.listdir(self._directory):
+            if self._pattern.fullmatch(entry):
+                path = os.path.join(self._directory, entry)
+                with open(path, encoding="utf-8") as file:
+                    for line in file:
+                        # a line without a newline was cut off by a crash
+                        if line.endswith("\n"):
+                            self._completed.add(line[:-1])
+
+    def isCompleted(self, case: ArgumentFileCase) -> bool:
+        return case.key in self._completed
+
+    def record(self, case: ArgumentFileCase):
+        """\
+        Record that a case has been completed. The entry is flushed
+        to disk before returning.
+
+        :param case: the completed case
+        """
+        if not self._file:
+            self._file = open(self._path, "a", encoding="utf-8")
+            # don't append to a line that was cut off by a crash
+            if self._file.tell() > 0:
+                with open(self._path, "rb") as file:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        self._file.write("\n")
+        self._file.write(case.key + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._completed.add(case.key)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @property
+    def path(self):
+        return self._path
+
+
+class ArgumentFileRunner:
+    """\
+    Runs the cases in an argument file that belong to one shard,
+    skipping any cases that are already in the journal.
+
+    The cases are divided among the shards by estimated cost, so every
+    shard gets a similar amount of work. When there's a journal directory,
+    the first shard to start writes the division to a plan file there and
+    every later start, on any machine, reads it. So the shards don't change
+    when font files are edited, or are missing on some machines, between
+    starts.
+
+    Relative font file paths in the argument file are relative to
+    the directory that contains the argument file.
+    """
+
+    def __init__(
+        self,
+        argumentFile: str,
+        journalDirectory: typing.Optional[str] = None,
+        shardIndex: int = 0,
+        shardCount: int = 1,
+        argsFactory: typing.Callable[[], typing.Any] = TestArgs,
+        costFunction: typing.Optional[typing.Callable[[typing.Any], int]] = None,
+    ):
+        """\
+        Initialize an ArgumentFileRunner.
+
+        :param argumentFile: the path of the argument file
+        :param journalDirectory: the directory for the journal files, or None for no journal
+        :param shardIndex: the index of the shard to run, from 0 to shardCount - 1
+        :param shardCount: the number of shards
+        :param argsFactory: a function that returns an object to process a case's arguments
+        :param costFunction: a function that estimates the cost of a case from its processed arguments
+        """
+        if shardCount < 1:
+            raise ValueError(f"Invalid shard count: {shardCount}")
+        if not 0 <= shardIndex < shardCount:
+            raise ValueError(f"Invalid shard index: {shardIndex} of {shardCount}")
+
+        self._argumentFile = argumentFile
+        self._argumentDirectory = os.path.dirname(os.path.abspath(argumentFile))
+        self._journalDirectory = journalDirectory
+        self._shardIndex = shardIndex
+        self._shardCount = shardCount
+        self._argsFactory = argsFactory
+        self._costFunction = costFunction or ArgumentFileRunner.fontFileCost
+        self._cases = ArgumentFileRunner.readCases(argumentFile)
+        self.checkCases()
+        self._journal = (
+            ArgumentFileJournal(
+                journalDirectory, argumentFile, f"shard{shardIndex}of{shardCount}"
+            )
+            if journalDirectory
+            else None
+        )
+
+    @staticmethod
+    def readCases(argumentFile: str) -> list[ArgumentFileCase]:
+        """\
+        Read the cases from an argument file.
+
+        :param argumentFile: the path of the argument file
+        :return: a list of ArgumentFileCase objects, in file order
+        """
+        cases: list[ArgumentFileCase] = []
+        occurrences: dict[tuple[str, ...], int] = {}
+        with open(argumentFile, encoding="utf-8") as file:
+            for lineNumber, line in enumerate(file, 1):
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    try:
+                        arguments = shlex.split(line)
+                    except ValueError as error:
+                        raise ValueError(f"line {lineNumber}: {error}")
+                    occurrence = occurrences.get(tuple(arguments), 0)
+                    occurrences[tuple(arguments)] = occurrence + 1
+                    cases.append(ArgumentFileCase(lineNumber, arguments, occurrence))
+
+        return cases
+
+    def checkCases(self):
+        """\
+        Process the arguments of every case, so that a bad line is reported
+        before any work starts, rather than stopping the run when it's reached.
+
+        Raise ValueError listing all the lines with invalid arguments.
+        """
+        errors: list[str] = []
+        for case in self._cases:
+            try:
+                self.argsForCase(case)
+            except ValueError as error:
+                errors.append(f"line {case.lineNumber}: {error}")
+
+        if errors:
+            raise ValueError(
+                f"Invalid arguments in “{self._argumentFile}”: {'; '.join(errors)}"
+            )
+
+    @staticmethod
+    def fontFileCost(args: typing.Any) -> int:
+        """\
+        Estimate the cost of a case as the size of its font file. For a
+        “.ufo” source this is the total size of the files in it.
+
+        :param args: the processed arguments of the case
+        :return: the estimated cost
+        """
+        fontFile = args.fontFile
+        if os.path.isdir(fontFile):
+            return sum(
+                os.path.getsize(os.path.join(path, name))
+                for path, _, names in os.walk(fontFile)
+                for name in names
+            )
+
+        return os.path.getsize(fontFile) if os.path.isfile(fontFile) else 0
+
+    def argsForCase(self, case: ArgumentFileCase) -> typing.Any:
+        args = self._argsFactory()
+        args.processArguments(case.arguments)
+        fontFile = getattr(args, "fontFile", None)
+        if fontFile and not os.path.isabs(fontFile):
+            args.fontFile = os.path.join(self._argumentDirectory, fontFile)
+        return args
+
+    def assignShards(self) -> dict[str, int]:
+        """\
+        Divide the cases among the shards. The most expensive cases are
+        assigned first, each to the shard with the lowest total cost so far.
+
+        :return: a dictionary mapping each case's key to its shard index
+        """
+        loads = [0] * self._shardCount
+        shards: dict[str, int] = {}
+
+        for case in self._cases:
+            case.cost = self._costFunction(self.argsForCase(case))
+
+        for case in sorted(self._cases, key=lambda c: (-c.cost, c.lineNumber)):
+            shard = loads.index(min(loads))
+            loads[shard] += max(case.cost, 1)
+            shards[case.key] = shard
+
+        return shards
+
+    def shardPlan(self) -> dict[str, int]:
+        """\
+        Get the division of the cases among the shards. If there's a journal
+        directory, the division is read from the plan file there, after
+        writing it if this is the first start for this number of shards.
+
+        Cases that were added to the argument file after the plan was written
+        are assigned by a hash of their key, so every shard agrees on them
+        without changing the plan.
+
+        :return: a dictionary mapping each case's key to its shard index
+        """
+        if not self._journalDirectory:
+            return self.assignShards()
+
+        planFile = os.path.join(
+            self._journalDirectory,
+            f"{os.path.basename(self._argumentFile)}.{self._shardCount}shards.plan",
+        )
+        if not os.path.exists(planFile):
+            shards = self.assignShards()
+            fd, tempFile = tempfile.mkstemp(dir=self._journalDirectory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    for key, shard in shards.items():
+                        file.write(f"{key} {shard}\n")
+                    file.flush()
+                    os.fsync(file.fileno())
+                # link() fails if the file exists, so the first writer wins
+                # and nobody ever sees a partially written plan.
+                os.link(tempFile, planFile)
+            except FileExistsError:
+                pass
+            finally:
+                os.remove(tempFile)
+
+        shards = {}
+        with open(planFile, encoding="utf-8") as file:
+            for line in file:
+                key, shard = line.split()
+                shards[key] = int(shard)
+
+        for case in self._cases:
+            if case.key not in shards:
+                digest = hashlib.sha1(case.key.encode("utf-8")).digest()
+                shards[case.key] = int.from_bytes(digest[:4], "big") % self._shardCount
+
+        return shards
+
+    def shardCases(self) -> list[ArgumentFileCase]:
+        """\
+        Get the cases that belong to this shard.
+
+        :return: the shard's cases, in file order
+        """
+        if self._shardCount == 1:
+            return list(self._cases)
+
+        shards = self.shardPlan()
+        return [c for c in self._cases if shards[c.key] == self._shardIndex]
+
+    def pendingCases(self) -> list[ArgumentFileCase]:
+        """\
+        Get the cases in this shard that aren't in the journal.
+        """
+        journal = self._journal
+        cases = self.shardCases()
+        return [c for c in cases if not journal.isCompleted(c)] if journal else cases
+
+    def run(self, test: typing.Callable[[typing.Any], typing.Any]) -> int:
+        """\
+        Run the pending cases in this shard, recording each one
+        in the journal after the test returns. If the test raises
+        an exception the run stops and the case isn't recorded,
+        so it will be run again next time.
+
+        :param test: a function that runs one case, given its processed arguments
+        :return: the number of cases run
+        """
+        count = 0
+        try:
+            for case in self.pendingCases():
+                test(self.argsForCase(case))
+                if self._journal:
+                    self._journal.record(case)
+                count += 1
+        finally:
+            if self._journal:
+                self._journal.close()
+
+        return count
+
+    @property
+    def cases(self):
+        return self._cases
+
+    @property
+    def journal(self):
+        return self._journal
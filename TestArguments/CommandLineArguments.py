@@ -146,6 +146,9 @@ class CommandLineArgs:
     A base class to hold the results of parsing the command line.
     """
 
+    # the ArgumentIterator class used to fetch the arguments
+    argumentIteratorClass: type[ArgumentIterator] = ArgumentIterator
+
     def __init__(self):
         # base class, so no CommandLineOptions
         self._options: list[CommandLineOption] = []
@@ -159,7 +162,7 @@ class CommandLineArgs:
 
         Raise ValueError for any unknow options or any missing required options.
         """
-        arguments = ArgumentIterator(argumentList)
+        arguments = self.argumentIteratorClass(argumentList)
         argumentsSeen: dict[str, bool] = {}
 
         for argument in arguments:
@@ -12,6 +12,8 @@ import typing
 # from fontTools.ttLib import ttFont, TTLibError
 from FontDocTools.Font import Font as FDTFont, Glyph as FDTGlyph
 
+from .GlyphNameTable import GlyphNameTable
+
 
 class Font(FDTFont):
     def __init__(
@@ -21,6 +23,27 @@ class Font(FDTFont):
         fontNumber: typing.Optional[int] = None,
     ):
         FDTFont.__init__(self, fontFile, fontName, fontNumber)
+        self._glyphNameTable: typing.Optional[GlyphNameTable] = None
+        self._glyphsByID: dict[int, FDTGlyph] = {}
+
+    @classmethod
+    def forFile(
+        cls,
+        fontFile: str,
+        fontName: typing.Optional[str] = None,
+        fontNumber: typing.Optional[int] = None,
+        lazyUFO: bool = False,
+    ) -> "Font":
+        """\
+        Returns a Font for the given file. If lazyUFO is True and the
+        file is a “.ufo” source, the Font only loads the glyphs that are used.
+        """
+        if lazyUFO and fontFile.rstrip("/").endswith(".ufo"):
+            from .UFOFont import UFOFont
+
+            return UFOFont(fontFile)
+
+        return cls(fontFile, fontName, fontNumber)
 
     def __contains__(self, item: str) -> bool:
         return self._hasTable(item)
@@ -52,6 +75,21 @@ class Font(FDTFont):
     def glyphSet(self):
         return self._ttFont.getGlyphSet()
 
+    @property
+    def glyphNameTable(self) -> GlyphNameTable:
+        """\
+        A table of the font's glyph names, used for fast lookups
+        by name and by glyph ID.
+
+        This doesn't save memory for a font file: the underlying TTFont
+        keeps its glyph order, and tables keyed by glyph name, for as long
+        as the font is open, so the table costs about 9 bytes per glyph
+        on top of them.
+        """
+        if self._glyphNameTable is None:
+            self._glyphNameTable = GlyphNameTable(self.glyphNames())
+        return self._glyphNameTable
+
     @property
     def hmtxMetrics(self):
         if not self._hMetrics:
@@ -79,21 +117,26 @@ class Font(FDTFont):
         """\
         Returns the glyph with the given name.
         """
-        glyphs = self._glyphs
-        if glyphName in glyphs:
-            return glyphs[glyphName]
-        if glyphName not in self._ttGlyphSet:
+        glyphID = self.glyphNameTable.glyphIDForName(glyphName)
+        if glyphID is None:
             raise ValueError(f"Unknown glyph name: “{glyphName}”.")
+
+        glyphs = self._glyphsByID
+        if glyphID in glyphs:
+            return glyphs[glyphID]
         # glyph = GTGlyph(self, glyphName)
         glyph = FDTGlyph(glyphName, self._ttGlyphName(glyphName), self)
-        glyphs[glyphName] = glyph
+        glyphs[glyphID] = glyph
         return glyph
 
     def glyphForIndex(self, index: int) -> FDTGlyph:
         """\
         Returns the glyph with the given glyph index.
         """
-        return self.glyphForName(self.glyphName(index))
+        glyphs = self._glyphsByID
+        if index in glyphs:
+            return glyphs[index]
+        return self.glyphForName(self.glyphNameTable[index])
 
     def glyphForCharacter(self, char: typing.Union[int, str]):
         """\
@@ -116,9 +159,7 @@ class Font(FDTFont):
         return char in cmap.keys()
 
     def hasGlyphName(self, glyphName: str) -> bool:
-        names = self.glyphNames()
-        return glyphName in names
+        return glyphName in self.glyphNameTable
 
     def hasGlyphIndex(self, glyphIndex: int):
-        names = self.glyphNames()
-        return glyphIndex < len(names)
+        return glyphIndex < len(self.glyphNameTable)
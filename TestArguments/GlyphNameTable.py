@@ -0,0 +1,155 @@
+"""\
+A compact, read-only table of the glyph names in a font.
+
+Created on October 19, 2026
+
+@author Eric Mader
+"""
+
+import typing
+
+import re
+from array import array
+
+# Algorithmic glyph names. Each entry is a regular expression that matches
+# the name, the base of the number in it and a format that recreates the name
+# from that number. A name is only treated as algorithmic if formatting its
+# number gives back exactly the same name; anything else, e.g. "uni00e9"
+# or "cid001", is stored as a literal name.
+#
+# "cid" and "glyph" names each have two entries: the five digit, zero padded
+# form that fontTools generates ("cid00001") and the unpadded form ("cid1").
+# The padded form is tried first, so names with five or more digits always
+# use it.
+_algorithmicNames: list[tuple[re.Pattern[str], int, str]] = [
+    (re.compile(r"uni([0-9A-F]{4})"), 16, "uni{:04X}"),
+    (re.compile(r"u([0-9A-F]{4,6})"), 16, "u{:04X}"),
+    (re.compile(r"cid([0-9]{1,10})"), 10, "cid{:05d}"),
+    (re.compile(r"glyph([0-9]{1,10})"), 10, "glyph{:05d}"),
+    (re.compile(r"cid([0-9]{1,10})"), 10, "cid{:d}"),
+    (re.compile(r"glyph([0-9]{1,10})"), 10, "glyph{:d}"),
+]
+
+# kind value for names stored in the byte buffer
+_literal = 0
+
+
+class GlyphNameTable:
+    """\
+    An immutable sequence of glyph names, indexed by glyph ID.
+
+    Rather than holding one str object per glyph, the table keeps a kind
+    byte and a number for each glyph. Algorithmic names such as “uni4E00”
+    or “cid01234” are recreated from the number when they're needed; all
+    other names are UTF-8 encoded into a single byte buffer and the number
+    is the index of the name's entry in an array of offsets into that buffer.
+
+    Name lookup uses an array of glyph IDs sorted by name, so it's a
+    binary search rather than a hash table of str objects.
+    """
+
+    __slots__ = "_kinds", "_values", "_buffer", "_offsets", "_sorted"
+
+    def __init__(self, names: typing.Iterable[str]):
+        """\
+        Initialize a GlyphNameTable.
+
+        :param names: the glyph names, in glyph ID order
+        """
+        kinds = array("B")
+        values = array("I")
+        buffer = bytearray()
+        offsets = array("I", [0])
+
+        for name in names:
+            kind, value = GlyphNameTable._algorithmicValue(name)
+            if kind == _literal:
+                value = len(offsets) - 1
+                buffer.extend(name.encode("utf-8"))
+                offsets.append(len(buffer))
+            kinds.append(kind)
+            values.append(value)
+
+        self._kinds = kinds
+        self._values = values
+        self._buffer = bytes(buffer)
+        self._offsets = offsets
+        self._sorted = array("I", sorted(range(len(kinds)), key=self._name))
+
+    @staticmethod
+    def _algorithmicValue(name: str) -> tuple[int, int]:
+        """\
+        Get the kind and number of an algorithmic glyph name.
+
+        :param name: the glyph name
+        :return: a tuple (kind, number), or (_literal, 0) if the name isn't algorithmic
+        """
+        for kind, (pattern, base, format) in enumerate(_algorithmicNames, 1):
+            m = pattern.fullmatch(name)
+            if m:
+                value = int(m.group(1), base=base)
+                if value <= 0xFFFFFFFF and format.format(value) == name:
+                    return (kind, value)
+
+        return (_literal, 0)
+
+    def _name(self, glyphID: int) -> str:
+        kind = self._kinds[glyphID]
+        value = self._values[glyphID]
+        if kind != _literal:
+            return _algorithmicNames[kind - 1][2].format(value)
+
+        offsets = self._offsets
+        return self._buffer[offsets[value] : offsets[value + 1]].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __getitem__(self, glyphID: int) -> str:
+        if glyphID < 0:
+            glyphID += len(self)
+        if not 0 <= glyphID < len(self):
+            raise IndexError("glyph ID out of range")
+        return self._name(glyphID)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return (self._name(gid) for gid in range(len(self)))
+
+    def __contains__(self, glyphName: object) -> bool:
+        return isinstance(glyphName, str) and self.glyphIDForName(glyphName) is not None
+
+    def glyphIDForName(self, glyphName: str) -> typing.Optional[int]:
+        """\
+        Get the glyph ID for a glyph name.
+
+        :param glyphName: the glyph name
+        :return: the glyph ID, or None if the name isn't in the table
+        """
+        sortedIDs = self._sorted
+        low = 0
+        high = len(sortedIDs)
+
+        while low < high:
+            mid = (low + high) // 2
+            glyphID = sortedIDs[mid]
+            name = self._name(glyphID)
+            if name == glyphName:
+                return glyphID
+            if name < glyphName:
+                low = mid + 1
+            else:
+                high = mid
+
+        return None
+
+    def index(self, glyphName: str) -> int:
+        """\
+        Get the glyph ID for a glyph name, like list.index().
+
+        :param glyphName: the glyph name
+        :return: the glyph ID
+        """
+        glyphID = self.glyphIDForName(glyphName)
+        if glyphID is None:
+            raise ValueError(f"Unknown glyph name: “{glyphName}”.")
+        return glyphID
@@ -88,34 +88,21 @@ class GlyphSpec(object):
 
         if self._type == GlyphSpec.glyphID:
             spec = typing.cast(int, self._spec)
-            names = font.glyphNames()
+            names = font.glyphNameTable
             return names[spec] if spec < len(names) else ""
 
         if self._type == GlyphSpec.name:
-            names = font.glyphNames()
             spec = typing.cast(str, self._spec)
-            return spec if spec in names else ""
+            return spec if font.hasGlyphName(spec) else ""
 
         return ""  # None
 
     def glyphIDForFont(self, font: Font):
         name = self.nameForFont(font)
-        names = font.glyphNames()
-
-        try:
-            return names.index(name)
-        except ValueError:
-            return None
+        return font.glyphNameTable.glyphIDForName(name)
 
     def charCodeForFont(self, font: Font):
-        charName = self.nameForFont(font)
-        cmap = font._ttFont.getBestCmap()
-
-        for code, name in cmap.items():
-            if name == charName:
-                return code
-
-        return None
+        return font.unicodeForName(self.nameForFont(font))
 
     def nameSpecForFont(self, font: Font):
         return self.specFromName(self.nameForFont(font))
@@ -10,6 +10,7 @@ import typing
 
 # from re import fullmatch
 from .GlyphSpec import GlyphSpec
+from .Font import Font
 from FontDocTools.ArgumentIterator import ArgumentIterator
 
 
@@ -78,6 +79,7 @@ class TestArgs:
         "needGlyph",
         "glyphSpec",
         "range",
+        "lazyUFO",
     )
 
     def __init__(self, needGlyph: bool = True):
@@ -88,6 +90,7 @@ class TestArgs:
         self.needGlyph = needGlyph
         self.glyphSpec: typing.Optional[GlyphSpec] = None
         self.range = (30, 70)
+        self.lazyUFO = False
         # self.steps = 20
 
     @classmethod
@@ -119,6 +122,8 @@ class TestArgs:
         #     self.steps = arguments.nextExtraAsPosInt("steps")
         elif argument == "--debug":
             self.debug = True
+        elif argument == "--lazy-ufo":
+            self.lazyUFO = True
         else:
             raise ValueError(f"Unrecognized option “{argument}”.")
 
@@ -143,6 +148,12 @@ class TestArgs:
         if self.needGlyph and not self.glyphSpec:
             raise ValueError("Missing “--glyph”")
 
+    def getFont(self) -> Font:
+        fontFile = typing.cast(str, self.fontFile)
+        return Font.forFile(
+            fontFile, self.fontName, self.fontNumber, lazyUFO=self.lazyUFO
+        )
+
     def getGlyph(self, font: typing.Any):
         glyphSpec = typing.cast(GlyphSpec, self.glyphSpec)
         return font.glyphForName(glyphSpec.nameForFont(font))
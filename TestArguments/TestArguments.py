@@ -10,6 +10,7 @@ import typing
 
 from .GlyphSpec import GlyphSpec
 from .CommandLineArguments import CommandLineOption, CommandLineArgs
+from .TestArgumentIterator import TestArgumentIterator
 from .Font import Font
 
 
@@ -18,6 +19,9 @@ class TestArgs(CommandLineArgs):
     A spec object for a basic font test command line
     """
 
+    # accepts “.ufo” font sources
+    argumentIteratorClass = TestArgumentIterator
+
     options = [
         CommandLineOption(
             "font",
@@ -34,6 +38,7 @@ class TestArgs(CommandLineArgs):
             None,
         ),
         CommandLineOption("debug", None, True, "debug", False, required=False),
+        CommandLineOption("lazy-ufo", None, True, "lazyUFO", False, required=False),
     ]
 
     def __init__(self):
@@ -41,6 +46,7 @@ class TestArgs(CommandLineArgs):
         self.fontName: typing.Optional[str] = None
         self.fontNumber: typing.Optional[int] = None
         self.debug: bool = False
+        self.lazyUFO: bool = False
         CommandLineArgs.__init__(self)
         # add in our CommandLineOptions
         self._options.extend(TestArgs.options)
@@ -48,5 +54,10 @@ class TestArgs(CommandLineArgs):
             "gid0"
         )  # this is only here to keep type checking happy... could use GlyphSpec | None, but then have to check for None below...
 
+    def getFont(self) -> Font:
+        return Font.forFile(
+            self.fontFile, self.fontName, self.fontNumber, lazyUFO=self.lazyUFO
+        )
+
     def getGlyph(self, font: Font):
         return font.glyphForName(self.glyphSpec.nameForFont(font))
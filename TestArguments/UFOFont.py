@@ -0,0 +1,426 @@
+"""\
+UFOFont.py
+
+A Font that loads a UFO source lazily.
+
+Created on October 19, 2026
+
+@author Eric Mader
+"""
+
+import typing
+
+import os
+import re
+import time
+import plistlib
+from collections.abc import Mapping
+
+from fontTools.agl import UV2AGL
+from fontTools.ufoLib.glifLib import readGlyphFromString
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.pens.pointPen import PointToSegmentPen
+from fontTools.pens.recordingPen import RecordingPointPen
+from FontDocTools.Font import Glyph as FDTGlyph
+
+from .Font import Font
+
+unicodeRE = re.compile(rb"<unicode\s+hex\s*=\s*[\"']([0-9a-fA-F]+)[\"']")
+
+
+# Identifies a version of a file. The size and inode are included because
+# many file systems only record the modification time to the second.
+FileSignature = typing.Optional[tuple[int, int, int]]
+
+
+def _fileSignature(path: str) -> FileSignature:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _readPlist(path: str, default: typing.Any) -> typing.Any:
+    try:
+        with open(path, "rb") as file:
+            return plistlib.load(file)
+    except FileNotFoundError:
+        return default
+
+
+class UFOGlyph:
+    """\
+    A glyph parsed from a “.glif” file. It has the same drawing
+    interface as the glyphs in a fontTools glyph set.
+    """
+
+    def __init__(self, glyphName: str, glyphSet: "UFOGlyphSet"):
+        self.name = glyphName
+        self.width = 0
+        self.height = 0
+        self.unicodes: list[int] = []
+        self.anchors: list[dict[str, typing.Any]] = []
+        self.guidelines: list[dict[str, typing.Any]] = []
+        self.lib: dict[str, typing.Any] = {}
+        self._glyphSet = glyphSet
+        self._outline = RecordingPointPen()
+
+    def drawPoints(self, pointPen: typing.Any):
+        self._outline.replay(pointPen)
+
+    def draw(self, pen: typing.Any):
+        self.drawPoints(PointToSegmentPen(pen))
+
+    @property
+    def lsb(self) -> int:
+        pen = BoundsPen(self._glyphSet)
+        self.draw(pen)
+        return round(pen.bounds[0]) if pen.bounds else 0
+
+
+class UFOGlyphSet(Mapping):
+    """\
+    A glyph set for a UFOFont. Each “.glif” file is parsed the first time
+    its glyph is used, and parsed again if the file has been modified.
+    """
+
+    def __init__(self, font: "UFOFont"):
+        self._font = font
+        self._parsedGlyphs: dict[str, tuple[str, FileSignature, UFOGlyph]] = {}
+
+    def __getitem__(self, glyphName: str) -> UFOGlyph:
+        path = self._font._glyphPath(glyphName)
+        if not path:
+            raise KeyError(glyphName)
+
+        signature = _fileSignature(path)
+        parsed = self._parsedGlyphs.get(glyphName)
+        if parsed and parsed[0] == path and parsed[1] == signature:
+            return parsed[2]
+
+        with open(path, "rb") as file:
+            data = file.read()
+        glyph = UFOGlyph(glyphName, self)
+        readGlyphFromString(data, glyph, glyph._outline)
+        self._parsedGlyphs[glyphName] = (path, signature, glyph)
+        self._font._glyphParsed(glyphName, path, signature, glyph.unicodes)
+        return glyph
+
+    def __contains__(self, glyphName: object) -> bool:
+        return isinstance(glyphName, str) and self._font.hasGlyphName(glyphName)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._font.glyphNames())
+
+    def __len__(self) -> int:
+        return len(self._font.glyphNames())
+
+
+class UFOFont(Font):
+    """\
+    A Font for a UFO source that only reads the metadata it needs to
+    index the glyphs. “contents.plist” gives the glyph names and their
+    “.glif” files, and “lib.plist” gives the glyph order. The indexes are
+    rebuilt if either file changes, and each “.glif” file is parsed
+    when its glyph is first used and again after the file changes.
+
+    Only the glyph, character and naming parts of the Font interface
+    are available. Members that need the compiled font tables raise
+    NotImplementedError.
+    """
+
+    def __init__(self, fontFile: str, recheckInterval: float = 1.0):
+        """\
+        Initialize a UFOFont.
+
+        :param fontFile: the path of the “.ufo” directory
+        :param recheckInterval: the minimum number of seconds between checks of all the “.glif” files
+        """
+        # Don't call Font.__init__(), it loads the whole source.
+        self._fontFile = fontFile
+        self._glyphsDirectory = os.path.join(fontFile, "glyphs")
+        self._glyphNameTable = None
+        self._glyphsByID: dict[int, FDTGlyph] = {}
+        self._glyphSources: dict[int, UFOGlyph] = {}
+        self._ttGlyphSet = UFOGlyphSet(self)
+        self._fontInfo: typing.Optional[dict[str, typing.Any]] = None
+        self._indexSignatures: tuple[FileSignature, FileSignature] = (None, None)
+        self._glyphFiles: dict[str, str] = {}
+        self._glyphOrder: list[str] = []
+        self._recheckInterval = recheckInterval
+        self._scannedFiles: dict[str, tuple[str, FileSignature, list[int]]] = {}
+        self._scannedCharCodes: dict[int, str] = {}
+        self._scanSignature: FileSignature = None
+        self._scanTime = 0.0
+        self._scanIsStale = True
+        self._checkIndex()
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # Only called for attributes that don't exist, i.e. the
+        # compiled font state that FDTFont's methods expect.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        raise AttributeError(
+            f"“{name}” isn't available for a UFO source loaded with lazyUFO."
+        )
+
+    def _unsupported(self, what: str) -> typing.NoReturn:
+        raise NotImplementedError(
+            f"{what} isn't available for “{self._fontFile}”, "
+            "it was loaded with lazyUFO."
+        )
+
+    def _checkIndex(self):
+        """\
+        Build the glyph indexes, or rebuild them if “contents.plist”
+        or “lib.plist” has changed since they were built.
+        """
+        contentsPath = os.path.join(self._glyphsDirectory, "contents.plist")
+        libPath = os.path.join(self._fontFile, "lib.plist")
+        signatures = (_fileSignature(contentsPath), _fileSignature(libPath))
+        if signatures[0] is None:
+            raise ValueError(f"Not a UFO source: “{self._fontFile}”.")
+
+        if signatures == self._indexSignatures:
+            return
+
+        glyphFiles: dict[str, str] = _readPlist(contentsPath, {})
+        lib = _readPlist(libPath, {})
+
+        order = [n for n in lib.get("public.glyphOrder", []) if n in glyphFiles]
+        glyphOrder = list(dict.fromkeys(order))
+        ordered = set(glyphOrder)
+        glyphOrder.extend(sorted(n for n in glyphFiles if n not in ordered))
+
+        self._indexSignatures = signatures
+        self._glyphFiles = glyphFiles
+        self._glyphOrder = glyphOrder
+        # glyph IDs may have changed
+        self._glyphNameTable = None
+        self._glyphsByID = {}
+        self._glyphSources = {}
+        # glyphs may have been added or renamed
+        self._scanIsStale = True
+
+    def _glyphPath(self, glyphName: str) -> typing.Optional[str]:
+        self._checkIndex()
+        fileName = self._glyphFiles.get(glyphName)
+        return os.path.join(self._glyphsDirectory, fileName) if fileName else None
+
+    def _ttGlyphName(self, glyphName: str) -> str:
+        return glyphName
+
+    def _scanCharCodes(self):
+        """\
+        Find the character codes of all the glyphs by scanning the “.glif”
+        files for “unicode” elements, without parsing them. Only files that
+        have changed since the last scan are read again, but every file has
+        to be checked, and the first scan reads all of them. So this is
+        only done when a character code can't be found from the glyph
+        names that usually have it; see glyphNameForCharacterCode().
+        """
+        scannedFiles: dict[str, tuple[str, FileSignature, list[int]]] = {}
+        changed = False
+
+        for glyphName in self._glyphOrder:
+            path = os.path.join(self._glyphsDirectory, self._glyphFiles[glyphName])
+            signature = _fileSignature(path)
+            scanned = self._scannedFiles.get(glyphName)
+            if not scanned or scanned[0] != path or scanned[1] != signature:
+                with open(path, "rb") as file:
+                    data = file.read()
+                codes = [int(m.group(1), base=16) for m in unicodeRE.finditer(data)]
+                scanned = (path, signature, codes)
+                changed = True
+            scannedFiles[glyphName] = scanned
+
+        if changed or scannedFiles.keys() != self._scannedFiles.keys():
+            self._scannedFiles = scannedFiles
+            self._updateScannedCharCodes()
+
+        self._scanSignature = _fileSignature(self._glyphsDirectory)
+        self._scanTime = time.monotonic()
+        self._scanIsStale = False
+
+    def _updateScannedCharCodes(self):
+        charCodes: dict[int, str] = {}
+        for glyphName, scanned in self._scannedFiles.items():
+            for charCode in scanned[2]:
+                charCodes.setdefault(charCode, glyphName)
+
+        self._scannedCharCodes = charCodes
+
+    def _glyphParsed(
+        self, glyphName: str, path: str, signature: FileSignature, unicodes: list[int]
+    ):
+        # Called by the glyph set when it parses a “.glif” file,
+        # so the scanned character codes can be kept up to date.
+        scanned = self._scannedFiles.get(glyphName)
+        if scanned and scanned[2] != unicodes:
+            self._scannedFiles[glyphName] = (path, signature, list(unicodes))
+            self._updateScannedCharCodes()
+
+    def _scanNeedsCheck(self) -> bool:
+        """\
+        Returns True if the “.glif” files should be checked for changes:
+        the glyphs have been added or renamed, a file has been replaced
+        (which changes the directory), or it's been at least recheckInterval
+        seconds since the last check.
+        """
+        return (
+            self._scanIsStale
+            or _fileSignature(self._glyphsDirectory) != self._scanSignature
+            or time.monotonic() - self._scanTime >= self._recheckInterval
+        )
+
+    @property
+    def fontInfo(self) -> dict[str, typing.Any]:
+        if self._fontInfo is None:
+            path = os.path.join(self._fontFile, "fontinfo.plist")
+            self._fontInfo = _readPlist(path, {})
+        return self._fontInfo
+
+    def __contains__(self, item: str) -> bool:
+        return False  # a UFO source has no tables
+
+    def __getitem__(self, item: str) -> typing.Any:
+        self._unsupported(f"The “{item}” table")
+
+    def table(self, tag: str) -> typing.Any:
+        self._unsupported(f"The “{tag}” table")
+
+    def fontMetric(self, tag: str, field: str) -> typing.Any:
+        self._unsupported(f"The “{tag}” table")
+
+    def fontNameEntry(self, nameID: int, language: typing.Optional[str]) -> str:
+        names = {
+            1: self.familyName,
+            2: self.fontInfo.get("styleName", "Regular"),
+            4: self.fullName,
+            6: self.postscriptName,
+        }
+        if nameID not in names:
+            self._unsupported(f"Name ID {nameID}")
+        return names[nameID]
+
+    def postScriptName(self) -> str:
+        return self.postscriptName
+
+    @property
+    def postscriptName(self) -> str:
+        info = self.fontInfo
+        if "postscriptFontName" in info:
+            return info["postscriptFontName"]
+        name = f"{self.familyName}-{info.get('styleName', 'Regular')}"
+        return name.replace(" ", "")
+
+    @property
+    def fullName(self) -> str:
+        info = self.fontInfo
+        if "postscriptFullName" in info:
+            return info["postscriptFullName"]
+        return f"{self.familyName} {info.get('styleName', 'Regular')}"
+
+    @property
+    def familyName(self) -> str:
+        return self.fontInfo.get("familyName", "")
+
+    @property
+    def glyphSet(self) -> UFOGlyphSet:
+        return self._ttGlyphSet
+
+    @property
+    def hmtxMetrics(self):
+        self._unsupported("The “hmtx” table")
+
+    @property
+    def vmtxMetrics(self):
+        self._unsupported("The “vmtx” table")
+
+    @property
+    def typographicAscender(self):
+        info = self.fontInfo
+        return info.get("openTypeOS2TypoAscender", info.get("ascender"))
+
+    @property
+    def typographicDescender(self):
+        info = self.fontInfo
+        return info.get("openTypeOS2TypoDescender", info.get("descender"))
+
+    def glyphNames(self) -> list[str]:
+        self._checkIndex()
+        return self._glyphOrder
+
+    def glyphName(self, index: int) -> str:
+        return self.glyphNames()[index]
+
+    @property
+    def glyphNameTable(self):
+        self._checkIndex()
+        return super().glyphNameTable
+
+    def glyphForName(self, glyphName: str) -> FDTGlyph:
+        """\
+        Returns the glyph with the given name. The glyph is made
+        again if its “.glif” file has changed.
+        """
+        glyphID = self.glyphNameTable.glyphIDForName(glyphName)
+        if glyphID is None:
+            raise ValueError(f"Unknown glyph name: “{glyphName}”.")
+
+        ufoGlyph = self._ttGlyphSet[glyphName]
+        glyph = self._glyphsByID.get(glyphID)
+        if glyph is None or self._glyphSources.get(glyphID) is not ufoGlyph:
+            glyph = FDTGlyph(glyphName, glyphName, self)
+            self._glyphsByID[glyphID] = glyph
+            self._glyphSources[glyphID] = ufoGlyph
+        return glyph
+
+    def glyphForIndex(self, index: int) -> FDTGlyph:
+        return self.glyphForName(self.glyphName(index))
+
+    def _hasCharacterCode(self, glyphName: str, charCode: int) -> bool:
+        return glyphName in self._glyphFiles and (
+            charCode in self._ttGlyphSet[glyphName].unicodes
+        )
+
+    def glyphNameForCharacterCode(self, charCode: int) -> str:
+        """\
+        Returns the name of the glyph for a character code, or "" if there
+        isn't one. The glyphs named “uniXXXX”, “uXXXXX” or with the AGL name
+        for the character are checked first, then the scanned character codes.
+
+        A character code that isn't in the scanned character codes is only
+        reported as missing after checking the “.glif” files for changes
+        when _scanNeedsCheck() says so, so repeated misses don't check
+        every file.
+        """
+        self._checkIndex()
+        candidates = [f"uni{charCode:04X}", f"u{charCode:04X}", UV2AGL.get(charCode)]
+        for glyphName in candidates:
+            if glyphName and self._hasCharacterCode(glyphName, charCode):
+                return glyphName
+
+        glyphName = self._scannedCharCodes.get(charCode)
+        if glyphName and self._hasCharacterCode(glyphName, charCode):
+            return glyphName
+
+        if not self._scanNeedsCheck():
+            return ""
+
+        self._scanCharCodes()
+        glyphName = self._scannedCharCodes.get(charCode)
+        if glyphName and self._hasCharacterCode(glyphName, charCode):
+            return glyphName
+
+        return ""
+
+    def unicodeForName(self, charName: str) -> typing.Optional[int]:
+        if not self.hasGlyphName(charName):
+            return None
+        unicodes = self._ttGlyphSet[charName].unicodes
+        return unicodes[0] if unicodes else None
+
+    def hasCharacterCode(self, char: int) -> bool:
+        return self.glyphNameForCharacterCode(char) != ""
@@ -0,0 +1,160 @@
+"""\
+Tests for ArgumentFileRunner.
+
+Created on October 19, 2026
+
+@author Eric Mader
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("FontDocTools")
+
+from TestArguments.ArgumentFileRunner import ArgumentFileRunner
+
+
+def writeArgumentFile(directory, sizes):
+    # one case per font, font i + 1 has size sizes[i]
+    lines = ["# a comment", ""]
+    for i, size in enumerate(sizes, 1):
+        (directory / f"f{i}.ttf").write_bytes(b"\0" * size)
+        lines.append(f"--font f{i}.ttf --glyph /A")
+
+    argumentFile = directory / "args.txt"
+    argumentFile.write_text("\n".join(lines) + "\n")
+    return str(argumentFile)
+
+
+def shardLines(argumentFile, journalDirectory, shardCount):
+    return [
+        [
+            c.lineNumber
+            for c in ArgumentFileRunner(
+                argumentFile, journalDirectory, i, shardCount
+            ).shardCases()
+        ]
+        for i in range(shardCount)
+    ]
+
+
+def test_shardAssignment(tmp_path):
+    argumentFile = writeArgumentFile(tmp_path, [1000, 2000, 3000, 4000, 5000, 6000])
+    journalDirectory = str(tmp_path / "journal")
+
+    shards = shardLines(argumentFile, journalDirectory, 3)
+    assert sorted(line for shard in shards for line in shard) == [3, 4, 5, 6, 7, 8]
+    assert shards == [[3, 8], [4, 7], [5, 6]]
+
+    # The plan is written by the first start, so changing a
+    # font file doesn't change the shards.
+    (tmp_path / "f1.ttf").write_bytes(b"\0" * 100000)
+    assert shardLines(argumentFile, journalDirectory, 3) == shards
+
+
+def test_relativeFontPaths(tmp_path, monkeypatch):
+    argumentFile = writeArgumentFile(tmp_path, [10])
+    monkeypatch.chdir(os.path.dirname(tmp_path))
+
+    fontFiles = []
+    ArgumentFileRunner(argumentFile).run(lambda args: fontFiles.append(args.fontFile))
+    assert fontFiles == [str(tmp_path / "f1.ttf")]
+
+
+def test_journalResume(tmp_path):
+    argumentFile = writeArgumentFile(tmp_path, [10, 20, 30, 40])
+    journalDirectory = str(tmp_path / "journal")
+    fontFiles = []
+
+    def crashOnThird(args):
+        if len(fontFiles) == 2:
+            raise RuntimeError("crash")
+        fontFiles.append(os.path.basename(args.fontFile))
+
+    runner = ArgumentFileRunner(argumentFile, journalDirectory)
+    with pytest.raises(RuntimeError):
+        runner.run(crashOnThird)
+    assert fontFiles == ["f1.ttf", "f2.ttf"]
+
+    # simulate a crash part way through writing an entry
+    with open(runner.journal.path, "a") as file:
+        file.write("99:abc")
+
+    runner = ArgumentFileRunner(argumentFile, journalDirectory)
+    assert runner.run(lambda args: fontFiles.append(args.fontFile)) == 2
+    assert len(fontFiles) == 4
+
+    # all the cases are done, and the entries after the torn line were kept
+    runner = ArgumentFileRunner(argumentFile, journalDirectory)
+    assert runner.pendingCases() == []
+
+
+def test_invalidArguments(tmp_path):
+    argumentFile = writeArgumentFile(tmp_path, [10])
+    with open(argumentFile, "a") as file:
+        file.write("--font f1.ttf --bogus\n")
+
+    with pytest.raises(ValueError, match="line 4"):
+        ArgumentFileRunner(argumentFile)
+
+
+def test_ufoCase(tmp_path):
+    argumentFile = writeArgumentFile(tmp_path, [10])
+    glyphs = tmp_path / "Test.ufo" / "glyphs"
+    glyphs.mkdir(parents=True)
+    (glyphs / "contents.plist").write_bytes(b"\0" * 100)
+    with open(argumentFile, "a") as file:
+        file.write("--font Test.ufo --glyph /A\n")
+
+    runner = ArgumentFileRunner(argumentFile, str(tmp_path / "journal"), 0, 2)
+    fontFiles = []
+    runner.run(lambda args: fontFiles.append(args.fontFile))
+
+    assert fontFiles == [str(tmp_path / "Test.ufo")]
+    assert runner.cases[1].cost == 100
+
+
+def test_editedArgumentFile(tmp_path):
+    argumentFile = writeArgumentFile(tmp_path, [10, 20, 30])
+    journalDirectory = str(tmp_path / "journal")
+    shards = shardLines(argumentFile, journalDirectory, 2)
+    ArgumentFileRunner(argumentFile, journalDirectory).run(lambda args: None)
+
+    # Adding lines doesn't invalidate the journal or the plan,
+    # and a new case is assigned to exactly one shard.
+    with open(argumentFile) as file:
+        lines = file.readlines()
+    lines.insert(0, "# a new comment\n")
+    lines.append("--font f1.ttf --glyph /B\n")
+    with open(argumentFile, "w") as file:
+        file.writelines(lines)
+
+    runner = ArgumentFileRunner(argumentFile, journalDirectory)
+    assert [c.lineNumber for c in runner.pendingCases()] == [7]
+
+    newShards = shardLines(argumentFile, journalDirectory, 2)
+    oldLines = [[line - 1 for line in shard if line != 7] for shard in newShards]
+    assert oldLines == shards
+    assert sum(shard.count(7) for shard in newShards) == 1
+
+
+def test_duplicateCases(tmp_path):
+    argumentFile = writeArgumentFile(tmp_path, [10])
+    with open(argumentFile, "a") as file:
+        file.write("--font f1.ttf --glyph /A\n")
+
+    runner = ArgumentFileRunner(argumentFile)
+    assert len({c.key for c in runner.cases}) == 2
+
+
+def test_journalNames(tmp_path):
+    journalDirectory = str(tmp_path / "journal")
+    argumentFile = writeArgumentFile(tmp_path, [10])
+    oldFile = str(tmp_path / "args.txt.old")
+    os.rename(argumentFile, oldFile)
+    ArgumentFileRunner(oldFile, journalDirectory).run(lambda args: None)
+
+    argumentFile = writeArgumentFile(tmp_path, [10])
+    runner = ArgumentFileRunner(argumentFile, journalDirectory)
+    assert len(runner.pendingCases()) == 1
@@ -0,0 +1,73 @@
+"""\
+Tests for Font.
+
+Created on October 19, 2026
+
+@author Eric Mader
+"""
+
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("fontTools")
+pytest.importorskip("FontDocTools")
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+from TestArguments.Font import Font
+from TestArguments.GlyphSpec import GlyphSpec
+
+glyphCount = 20000
+
+
+@pytest.fixture(scope="module")
+def fontFile(tmp_path_factory):
+    glyphOrder = [".notdef", "A"] + [f"cid{gid:05d}" for gid in range(2, glyphCount)]
+    emptyGlyph = TTGlyphPen(None).glyph()
+
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyphOrder)
+    builder.setupCharacterMap({0x41: "A"})
+    builder.setupGlyf({name: emptyGlyph for name in glyphOrder})
+    builder.setupHorizontalMetrics({name: (500, 0) for name in glyphOrder})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    builder.setupOS2()
+    builder.setupPost()
+
+    path = tmp_path_factory.mktemp("fonts") / "Test.ttf"
+    builder.save(str(path))
+    return str(path)
+
+
+def test_glyphLookup(fontFile):
+    font = Font(fontFile)
+    names = font.glyphNames()
+
+    assert font.hasGlyphName("cid01234")
+    assert not font.hasGlyphName("cid1234")
+    assert font.hasGlyphIndex(glyphCount - 1)
+    assert not font.hasGlyphIndex(glyphCount)
+    assert GlyphSpec("/cid01234").glyphIDForFont(font) == names.index("cid01234")
+    assert GlyphSpec("gid1").nameForFont(font) == "A"
+    assert font.glyphForIndex(1) is font.glyphForName("A")
+
+
+def test_glyphNameTableMemory(fontFile):
+    # The glyph name table is an index for lookups. fontTools keeps
+    # its own names while the font is open, so this measures what the
+    # table adds to a Font, which should be no more than 10 bytes a glyph.
+    font = Font(fontFile)
+    font.glyphNames()
+
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        font.glyphNameTable
+        added = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    assert added <= 10 * glyphCount
@@ -0,0 +1,77 @@
+"""\
+Tests for GlyphNameTable.
+
+Created on October 19, 2026
+
+@author Eric Mader
+"""
+
+import tracemalloc
+
+import pytest
+
+from TestArguments.GlyphNameTable import GlyphNameTable
+
+names = [
+    ".notdef",
+    "space",
+    "A",
+    "uni00E9",
+    "uni00e9",  # lower case hex isn't algorithmic
+    "u1F600",
+    "cid00001",
+    "cid12",
+    "cid001",  # unusual width isn't algorithmic
+    "glyph00003",
+    "glyph7",
+    "é.alt",
+]
+
+
+def test_roundTrip():
+    table = GlyphNameTable(names)
+
+    assert len(table) == len(names)
+    assert list(table) == names
+    assert [table[gid] for gid in range(len(names))] == names
+    assert table[-1] == names[-1]
+
+    with pytest.raises(IndexError):
+        table[len(names)]
+
+
+def test_lookup():
+    table = GlyphNameTable(names)
+
+    for gid, name in enumerate(names):
+        assert name in table
+        assert table.glyphIDForName(name) == gid
+        assert table.index(name) == gid
+
+    for name in ["cid1", "cid00012", "uni00E8", "B", ""]:
+        assert name not in table
+        assert table.glyphIDForName(name) is None
+
+    with pytest.raises(ValueError):
+        table.index("B")
+
+
+def test_memory():
+    # The names of a 65k glyph CID font should take at least 5x less
+    # memory in the table than as a list of str objects.
+    glyphCount = 65535
+
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        nameList = [f"cid{gid:05d}" for gid in range(glyphCount)]
+        listSize = tracemalloc.get_traced_memory()[0] - start
+
+        start = tracemalloc.get_traced_memory()[0]
+        table = GlyphNameTable(nameList)
+        tableSize = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    assert table[glyphCount - 1] == f"cid{glyphCount - 1:05d}"
+    assert tableSize * 5 <= listSize
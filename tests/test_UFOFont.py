@@ -0,0 +1,172 @@
+"""\
+Tests for UFOFont.
+
+Created on October 19, 2026
+
+@author Eric Mader
+"""
+
+import os
+import plistlib
+
+import pytest
+
+pytest.importorskip("fontTools")
+pytest.importorskip("FontDocTools")
+
+from TestArguments.Font import Font
+from TestArguments.GlyphSpec import GlyphSpec
+from TestArguments import TestArguments
+from TestArguments.UFOFont import UFOFont
+
+
+def glifData(glyphName, width, unicodes):
+    codes = "".join(f'<unicode hex="{code:04X}"/>' for code in unicodes)
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<glyph name="{glyphName}" format="2"><advance width="{width}"/>{codes}'
+        f'<outline><contour><point x="10" y="0" type="line"/>'
+        f'<point x="100" y="0" type="line"/><point x="100" y="100" type="line"/>'
+        f"</contour></outline></glyph>\n"
+    )
+
+
+class UFO:
+    def __init__(self, path):
+        self.path = str(path)
+        self.glyphs = path / "glyphs"
+        self.glyphs.mkdir(parents=True)
+        self.contents = {}
+
+    def writeGlyph(self, glyphName, width, unicodes, fileName=None):
+        fileName = fileName or f"{glyphName}.glif"
+        path = self.glyphs / fileName
+        path.write_text(glifData(glyphName, width, unicodes))
+        if self.contents.get(glyphName) != fileName:
+            self.contents[glyphName] = fileName
+            self.writePlist(self.glyphs / "contents.plist", self.contents)
+
+    def writeGlyphOrder(self, glyphOrder):
+        libPath = os.path.join(self.path, "lib.plist")
+        self.writePlist(libPath, {"public.glyphOrder": glyphOrder})
+
+    @staticmethod
+    def writePlist(path, value):
+        with open(path, "wb") as file:
+            plistlib.dump(value, file)
+
+
+@pytest.fixture
+def ufo(tmp_path):
+    ufo = UFO(tmp_path / "Test.ufo")
+    ufo.writeGlyph(".notdef", 500, [])
+    ufo.writeGlyph("A", 600, [0x41], "A_.glif")
+    ufo.writeGlyph("uni00E9", 550, [0xE9])
+    ufo.writeGlyph("ex", 400, [0x78])
+    ufo.writeGlyphOrder([".notdef", "ex", "A", "ex"])
+    return ufo
+
+
+def test_index(ufo):
+    font = Font.forFile(ufo.path, lazyUFO=True)
+
+    assert isinstance(font, UFOFont)
+    # duplicates in public.glyphOrder are dropped, glyphs not in it are sorted
+    assert font.glyphNames() == [".notdef", "ex", "A", "uni00E9"]
+    assert GlyphSpec("/A").glyphIDForFont(font) == 2
+    # nothing has been parsed yet
+    assert font.glyphSet._parsedGlyphs == {}
+
+    ufo.writeGlyphOrder(["A", ".notdef"])
+    assert font.glyphNames() == ["A", ".notdef", "ex", "uni00E9"]
+    assert GlyphSpec("/A").glyphIDForFont(font) == 0
+    assert GlyphSpec("gid2").nameForFont(font) == "ex"
+
+
+def test_glyphInvalidation(ufo):
+    font = UFOFont(ufo.path)
+
+    glyph = font.glyphSet["A"]
+    assert glyph.width == 600
+    assert glyph.lsb == 10
+    assert font.glyphSet["A"] is glyph
+    assert list(font.glyphSet._parsedGlyphs) == ["A"]
+
+    ufo.writeGlyph("A", 6500, [0x41], "A_.glif")
+    assert font.glyphSet["A"].width == 6500
+
+
+def test_sameModificationTime(ufo):
+    # Many file systems only record the modification time to the
+    # second, so an edit may not change it.
+    font = UFOFont(ufo.path)
+    assert font.glyphSet["A"].width == 600
+
+    path = ufo.glyphs / "A_.glif"
+    stat = os.stat(path)
+    ufo.writeGlyph("A", 6500, [0x41], "A_.glif")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert font.glyphSet["A"].width == 6500
+
+
+def test_charCodes(ufo):
+    font = UFOFont(ufo.path, recheckInterval=0)
+
+    # found by name, without scanning
+    assert font.glyphNameForCharacterCode(0x41) == "A"
+    assert font.glyphNameForCharacterCode(0xE9) == "uni00E9"
+    assert font._scannedFiles == {}
+
+    # found by scanning
+    assert font.glyphNameForCharacterCode(0x78) == "ex"
+    assert GlyphSpec("x").nameForFont(font) == "ex"
+    assert font.glyphNameForCharacterCode(0x79) == ""
+    assert GlyphSpec("/A").charCodeForFont(font) == 0x41
+
+    # a character code added to an existing glyph is found
+    ufo.writeGlyph("ex", 400, [0x78, 0x79])
+    assert font.glyphNameForCharacterCode(0x79) == "ex"
+
+    # and one that's removed isn't
+    ufo.writeGlyph("ex", 400, [0x79])
+    assert font.glyphNameForCharacterCode(0x78) == ""
+
+
+def test_charCodeMisses(ufo, monkeypatch):
+    font = UFOFont(ufo.path)
+    assert font.glyphNameForCharacterCode(0x78) == "ex"
+
+    def scanCharCodes():
+        raise AssertionError("scanned the .glif files again")
+
+    # misses within the recheck interval don't check the files again
+    monkeypatch.setattr(font, "_scanCharCodes", scanCharCodes)
+    assert font.glyphNameForCharacterCode(0x79) == ""
+    assert font.glyphNameForCharacterCode(0x7A) == ""
+
+    # but a glyph that's reloaded updates the scanned character codes
+    ufo.writeGlyph("ex", 400, [0x78, 0x79])
+    assert font.glyphSet["ex"].unicodes == [0x78, 0x79]
+    assert font.glyphNameForCharacterCode(0x79) == "ex"
+
+
+def test_unsupported(ufo):
+    font = UFOFont(ufo.path)
+
+    with pytest.raises(NotImplementedError):
+        font["hmtx"]
+    with pytest.raises(NotImplementedError):
+        font.hmtxMetrics
+    with pytest.raises(NotImplementedError):
+        font.fontNameEntry(13, "en")
+    assert "glyf" not in font
+
+
+def test_lazyUFOOption(ufo):
+    args = TestArguments.TestArgs()
+    args.processArguments(["--font", ufo.path, "--glyph", "/A", "--lazy-ufo"])
+    font = args.getFont()
+
+    assert isinstance(font, UFOFont)
+    assert args.getGlyph(font) is font.glyphForName("A")